@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import Optional, Union
+import asyncio
 import os
 import aiohttp
 from microsoft.agents.hosting.core import ActivityHandler, MessageFactory, TurnContext
@@ -14,6 +15,32 @@ class WeatherForecastAgentResponse(BaseModel):
     content: Union[dict, str]
 
 
+# One client session per process so backend calls reuse keep-alive connections
+# instead of opening a new TCP/TLS connection per message.
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOCK = asyncio.Lock()
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        return _SESSION
+    async with _SESSION_LOCK:
+        if _SESSION is None or _SESSION.closed:
+            _SESSION = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=120),
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75),
+            )
+    return _SESSION
+
+
+async def close_session(_app=None) -> None:
+    global _SESSION
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
+
+
 class CustomEngineAgent(ActivityHandler):
     def __init__(self):
         return super().__init__()
@@ -31,22 +58,23 @@ class CustomEngineAgent(ActivityHandler):
         endpoint = f"{base_url.rstrip('/')}/generate-blog"
 
         try:
-            timeout = aiohttp.ClientTimeout(total=120)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(endpoint, json={"prompt": user_text}) as resp:
-                    if resp.status != 200:
-                        err_text = await resp.text()
-                        message = f"Request failed ({resp.status}). {err_text[:300]}"
-                        activity = MessageFactory.text(message)
-                        return await turn_context.send_activity(activity)
-
-                    data = await resp.json(content_type=None)
-                    content = data.get("content") if isinstance(data, dict) else None
-                    if not content:
-                        content = "No content returned from generator."
-
-                    activity = MessageFactory.text(content)
+            session = await _get_session()
+            async with session.post(
+                endpoint, json={"prompt": user_text}, headers={"Accept-Encoding": "gzip"}
+            ) as resp:
+                if resp.status != 200:
+                    err_text = await resp.text()
+                    message = f"Request failed ({resp.status}). {err_text[:300]}"
+                    activity = MessageFactory.text(message)
                     return await turn_context.send_activity(activity)
+
+                data = await resp.json(content_type=None)
+                content = data.get("content") if isinstance(data, dict) else None
+                if not content:
+                    content = "No content returned from generator."
+
+                activity = MessageFactory.text(content)
+                return await turn_context.send_activity(activity)
         except Exception as e:
             activity = MessageFactory.text(f"Error contacting generator: {e}")
             return await turn_context.send_activity(activity)
\ No newline at end of file
@@ -2,9 +2,15 @@
 # Licensed under the MIT License.
 
 import pathlib
+import socket
 from os import environ, path
 from dotenv import load_dotenv
-from aiohttp.web import Application, Request, Response, run_app
+from aiohttp.web import Application, Request, Response, StreamResponse, run_app
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 from microsoft.agents.activity import load_configuration_from_env
 from microsoft.agents.authentication.msal import MsalConnectionManager
@@ -13,7 +19,7 @@ from microsoft.agents.hosting.core import Authorization, MemoryStorage, UserStat
 
 from config import DefaultConfig
 
-from agent import CustomEngineAgent
+from agent import CustomEngineAgent, close_session
 
 load_dotenv(path.join(path.dirname(__file__), ".env"))
 
@@ -26,8 +32,6 @@ CONNECTION_MANAGER = MsalConnectionManager(**agents_sdk_config)
 ADAPTER = CloudAdapter(connection_manager=CONNECTION_MANAGER)
 AUTHORIZATION = Authorization(STORAGE, CONNECTION_MANAGER, **agents_sdk_config)
 
-USER_STATE = UserState(STORAGE)
-
 # Create the agent based on configuration
 AGENT = CustomEngineAgent()
 
@@ -37,22 +41,37 @@ async def messages(req: Request) -> Response:
     adapter: CloudAdapter = req.app["adapter"]
     return await adapter.process(req, AGENT)
 
+async def init_user_state(app: Application) -> None:
+    app["user_state"] = UserState(STORAGE)
+
 APP = Application()
 APP.router.add_post("/api/messages", messages)
 
-# Add static file handling for CSS, JS, etc.
+# Let browsers and CDNs cache static assets instead of re-fetching them
+async def static_cache_headers(req: Request, resp: StreamResponse) -> None:
+    if req.path.startswith("/public/"):
+        resp.headers.setdefault("Cache-Control", "public, max-age=86400")
+
+# Add static file handling for CSS, JS, etc. (opt-in with SERVE_STATIC=1)
 static_path = pathlib.Path(__file__).parent / "public"
-if static_path.exists():
-    APP.router.add_static("/public", static_path)
+if environ.get("SERVE_STATIC") == "1" and static_path.exists():
+    APP.router.add_static("/public", static_path, follow_symlinks=False, show_index=False)
+    APP.on_response_prepare.append(static_cache_headers)
 
 APP["agent_configuration"] = CONFIG
 APP["adapter"] = ADAPTER
+APP.on_startup.append(init_user_state)
+APP.on_cleanup.append(close_session)
 
 if __name__ == "__main__":
     try:
         port = CONFIG.PORT
         host = environ.get("HOST", "0.0.0.0")
         print(f"\nServer listening on {host}:{port} for appId {CONFIG.CLIENT_ID}")
-        run_app(APP, host=host, port=port)
+        loop = uvloop.new_event_loop() if uvloop else None
+        # SO_REUSEPORT lets several proxy processes bind the same port and the kernel
+        # spread connections across them (not available on Windows).
+        reuse_port = hasattr(socket, "SO_REUSEPORT")
+        run_app(APP, host=host, port=port, loop=loop, reuse_port=reuse_port, backlog=1024)
     except Exception as exc:  # pragma: no cover
         raise exc
\ No newline at end of file